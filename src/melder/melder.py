@@ -1,5 +1,3 @@
-import uuid
-
 #meld() = resolver
 #conduit() = scope
 #bind() = registration